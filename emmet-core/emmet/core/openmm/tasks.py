@@ -2,23 +2,244 @@
 
 from __future__ import annotations
 
+import array
+import base64
+import csv
+import hashlib
 import io
+import mmap
+import multiprocessing
+import os
+import sys
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional, Union, TYPE_CHECKING
+from typing import Literal, Optional, Union, TYPE_CHECKING
 
+import numpy as np
 import openmm
-import pandas as pd  # type: ignore[import-untyped]
 from openmm import XmlSerializer
-from openmm.app import Simulation
+from openmm.app import Simulation, Topology
 from openmm.app.pdbfile import PDBFile
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    PlainValidator,
+    PrivateAttr,
+    WithJsonSchema,
+    field_validator,
+)
+from typing_extensions import Annotated
 
 from emmet.core.openff import MDTaskDocument  # type: ignore[import-untyped]
-from emmet.core.openff.tasks import CompressedStr  # type: ignore[import-untyped]
+from emmet.core.openff.tasks import (  # type: ignore[import-untyped]
+    compressed_str_validator,
+)
 from emmet.core.vasp.task_valid import TaskState
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    from pyarrow import feather as pa_feather
+    from pyarrow import ipc as pa_ipc
+    from pyarrow import parquet as pa_pq
+except ImportError:
+    pa = None
+    pa_csv = None
+    pa_feather = None
+    pa_ipc = None
+    pa_pq = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
     from typing import Any
+    from pyarrow import Table as ArrowTable
+
+
+def _time_series_array(a: np.ndarray) -> np.ndarray:
+    if a.ndim != 1:
+        raise ValueError(f"Expected a 1D array, got {a.ndim}D")
+    # arrow and polars hand over read-only views of their own buffers, so
+    # their columns are copied once here and the arrays are writable whichever
+    # reader produced them; writable contiguous arrays (e.g. from the csv
+    # module reader) are stored as is. Contiguity lets orjson serialize them
+    return np.require(a, requirements=["C", "W"])
+
+
+def float_array_validator(o: Any) -> np.ndarray:
+    return _time_series_array(np.asarray(o, dtype=np.float64))
+
+
+def int_array_validator(o: Any) -> np.ndarray:
+    a = np.asarray(o)
+    values = a.astype(np.int64, copy=False)
+    if a.dtype.kind not in "iub" and not np.array_equal(values, a):
+        raise ValueError("Expected integer values")
+    return _time_series_array(values)
+
+
+def array_serializer(a: np.ndarray) -> list:
+    return a.tolist()
+
+
+# these types hold time series as contiguous numpy arrays in memory
+# and serialize them as plain lists
+FloatArray = Annotated[
+    np.ndarray,
+    PlainValidator(float_array_validator),
+    PlainSerializer(array_serializer),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
+
+IntArray = Annotated[
+    np.ndarray,
+    PlainValidator(int_array_validator),
+    PlainSerializer(array_serializer),
+    WithJsonSchema({"type": "array", "items": {"type": "integer"}}),
+]
+
+
+# StateDataReporter columns and the CalculationOutput fields they are stored in
+_STATE_COLUMN_NAME_MAP: dict[str, str] = {
+    '#"Step"': "steps_reported",
+    "Potential Energy (kJ/mole)": "potential_energy",
+    "Kinetic Energy (kJ/mole)": "kinetic_energy",
+    "Total Energy (kJ/mole)": "total_energy",
+    "Temperature (K)": "temperature",
+    "Box Volume (nm^3)": "volume",
+    "Density (g/mL)": "density",
+}
+_STATE_CSV_COLS = list(_STATE_COLUMN_NAME_MAP)
+_STATE_PY_COLS = list(_STATE_COLUMN_NAME_MAP.values())
+_STATE_COLUMN_DTYPES = {
+    name: "int64" if name == '#"Step"' else "float64" for name in _STATE_CSV_COLS
+}
+
+_TRAJ_BLOB_PREFIX = "zlib-b85:"
+
+
+def _size_or_zero(path: Union[Path, str]) -> int:
+    """Size of a file in bytes with a single stat call, 0 if it does not exist."""
+    try:
+        return os.stat(path).st_size
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+
+
+def _encode_traj(traj_file: Union[Path, str], chunk_size: int = 1 << 20) -> str:
+    """Compress a non-empty trajectory file and base85 encode it.
+
+    The file is memory mapped and fed to the compressor one chunk at a time,
+    so it is never copied into a single bytes object.
+    """
+    compressor = zlib.compressobj()
+    chunks: list[str] = []
+    pending = b""
+    with open(traj_file, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm, memoryview(mm) as view:
+        for start in range(0, len(view), chunk_size):
+            pending += compressor.compress(view[start : start + chunk_size])
+            # base85 encodes 4 byte groups, carry the remainder to the next chunk
+            cut = len(pending) - len(pending) % 4
+            chunks.append(base64.b85encode(pending[:cut]).decode("ascii"))
+            pending = pending[cut:]
+    pending += compressor.flush()
+    chunks.append(base64.b85encode(pending).decode("ascii"))
+    return _TRAJ_BLOB_PREFIX + "".join(chunks)
+
+
+def decode_traj_blob(traj_blob: str) -> bytes:
+    """Recover the trajectory file bytes from a CalculationOutput.traj_blob.
+
+    Blobs without the compression prefix are hex encoded, as written by
+    older versions of emmet.
+    """
+    if traj_blob.startswith(_TRAJ_BLOB_PREFIX):
+        encoded = traj_blob[len(_TRAJ_BLOB_PREFIX) :]
+        return zlib.decompress(base64.b85decode(encoded))
+    return bytes.fromhex(traj_blob)
+
+
+def traj_blob_validator(s: str) -> str:
+    # blobs from older versions of emmet were hex encoded and stored as a
+    # CompressedStr, unwrap those to the plain hex string
+    if s.startswith(_TRAJ_BLOB_PREFIX):
+        return s
+    return compressed_str_validator(s)
+
+
+# prefixed blobs are already compressed, so unlike CompressedStr this type
+# stores the string as is
+TrajBlob = Annotated[
+    str,
+    PlainValidator(traj_blob_validator),
+    WithJsonSchema({"type": "string"}),
+]
+
+
+def _state_table_to_dict(table: ArrowTable) -> dict[str, Any]:
+    """Extract the known state columns of an arrow table as numpy arrays."""
+    return {
+        _STATE_COLUMN_NAME_MAP[name]: table.column(name).to_numpy()
+        for name in table.column_names
+        if name in _STATE_COLUMN_NAME_MAP
+    }
+
+
+def _read_state_csv(state_file: Union[Path, str]) -> dict[str, Any]:
+    """Read the known state columns of a CSV file with the csv module.
+
+    Used when neither polars nor pyarrow is installed; for these narrow
+    numeric files it is faster than pandas as no index or block manager is
+    built.
+    """
+    with open(state_file, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        int_columns: dict[int, array.array[int]] = {}
+        float_columns: dict[int, array.array[float]] = {}
+        for i, name in enumerate(header):
+            if _STATE_COLUMN_DTYPES.get(name) == "int64":
+                int_columns[i] = array.array("q")
+            elif name in _STATE_COLUMN_DTYPES:
+                float_columns[i] = array.array("d")
+        for row in reader:
+            if not row:
+                continue
+            for i, ints in int_columns.items():
+                ints.append(int(row[i]))
+            # like the other readers, pad missing and empty fields with NaN,
+            # e.g. the last row of a job killed while writing
+            n_fields = len(row)
+            for i, floats in float_columns.items():
+                field = row[i] if i < n_fields else ""
+                floats.append(float(field) if field else np.nan)
+
+    attributes: dict[str, Any] = {}
+    for i, ints in int_columns.items():
+        attributes[_STATE_COLUMN_NAME_MAP[header[i]]] = np.frombuffer(
+            ints, dtype=np.int64
+        )
+    for i, floats in float_columns.items():
+        attributes[_STATE_COLUMN_NAME_MAP[header[i]]] = np.frombuffer(
+            floats, dtype=np.float64
+        )
+    return attributes
 
 
 class CalculationInput(BaseModel):  # type: ignore[call-arg]
@@ -103,8 +324,21 @@ class CalculationInput(BaseModel):  # type: ignore[call-arg]
         description="Whether to embed the trajectory blob in CalculationOutput.",
     )
 
+    state_file_format: Optional[Literal["csv", "parquet", "feather"]] = Field(
+        None,
+        description="The format of the state file to save.",
+    )
+
     model_config = ConfigDict(extra="allow")
 
+    @field_validator(
+        "platform_name", "state_file_name", "traj_file_name", "traj_file_type"
+    )
+    @classmethod
+    def intern_str(cls, v):
+        """Share one string object between the many inputs repeating a value."""
+        return sys.intern(v) if v else v
+
 
 class CalculationOutput(BaseModel):
     """OpenMM calculation output files and extracted data."""
@@ -117,42 +351,90 @@ class CalculationOutput(BaseModel):
         None, description="Path to the trajectory file relative to `dir_name`"
     )
 
-    traj_blob: Optional[CompressedStr] = Field(
-        None, description="Trajectory file bytes blob hex encoded to a string"
+    traj_blob: Optional[TrajBlob] = Field(
+        None,
+        description=(
+            "Trajectory file bytes blob compressed and base85 encoded to a "
+            "string, see `decode_traj_blob`"
+        ),
     )
 
     state_file: Optional[str] = Field(
         None, description="Path to the state file relative to `dir_name`"
     )
 
-    steps_reported: Optional[list[int]] = Field(
+    steps_reported: Optional[IntArray] = Field(
         None, description="Steps where outputs are reported"
     )
 
-    time: Optional[list[float]] = Field(None, description="List of times")
+    time: Optional[FloatArray] = Field(None, description="List of times")
 
-    potential_energy: Optional[list[float]] = Field(
+    potential_energy: Optional[FloatArray] = Field(
         None, description="List of potential energies"
     )
 
-    kinetic_energy: Optional[list[float]] = Field(
+    kinetic_energy: Optional[FloatArray] = Field(
         None, description="List of kinetic energies"
     )
 
-    total_energy: Optional[list[float]] = Field(
+    total_energy: Optional[FloatArray] = Field(
         None, description="List of total energies"
     )
 
-    temperature: Optional[list[float]] = Field(None, description="List of temperatures")
+    temperature: Optional[FloatArray] = Field(None, description="List of temperatures")
 
-    volume: Optional[list[float]] = Field(None, description="List of volumes")
+    volume: Optional[FloatArray] = Field(None, description="List of volumes")
 
-    density: Optional[list[float]] = Field(None, description="List of densities")
+    density: Optional[FloatArray] = Field(None, description="List of densities")
 
     elapsed_time: Optional[float] = Field(
         None, description="Elapsed time for the calculation (seconds)."
     )
 
+    @field_validator("traj_file", "state_file")
+    @classmethod
+    def intern_str(cls, v):
+        """Share one string object between the many outputs repeating a value."""
+        return sys.intern(v) if v else v
+
+    def __eq__(self, other: object) -> bool:
+        # arrays can't be compared with the dict equality used by BaseModel
+        if not isinstance(other, CalculationOutput):
+            return NotImplemented
+        for name in type(self).model_fields:
+            a, b = getattr(self, name), getattr(other, name)
+            if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+                if not np.array_equal(a, b):
+                    return False
+            elif a != b:
+                return False
+        return True
+
+    def model_dump_json(self, **kwargs) -> str:
+        """Serialize to JSON, writing the time series arrays with orjson.
+
+        orjson encodes numpy arrays directly rather than converting every
+        element to a Python float first. Falls back to pydantic if orjson is
+        not installed or any serialization options are given.
+        """
+        if orjson is None or kwargs:
+            return super().model_dump_json(**kwargs)
+        array_fields = {
+            name
+            for name in type(self).model_fields
+            if isinstance(getattr(self, name), np.ndarray)
+        }
+        data = self.model_dump(exclude=array_fields)
+        data = {
+            name: getattr(self, name) if name in array_fields else data[name]
+            for name in type(self).model_fields
+        }
+        # arrays orjson can't encode natively, e.g. non-contiguous ones
+        # assigned after validation, fall through to default
+        return orjson.dumps(
+            data, default=array_serializer, option=orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+
     @classmethod
     def from_directory(
         cls,
@@ -163,37 +445,99 @@ class CalculationOutput(BaseModel):
         embed_traj: bool = False,
     ) -> CalculationOutput:
         """Extract data from the output files in the directory."""
-        state_file = Path(dir_name) / state_file_name
-        column_name_map: dict[str, str] = {
-            '#"Step"': "steps_reported",
-            "Potential Energy (kJ/mole)": "potential_energy",
-            "Kinetic Energy (kJ/mole)": "kinetic_energy",
-            "Total Energy (kJ/mole)": "total_energy",
-            "Temperature (K)": "temperature",
-            "Box Volume (nm^3)": "volume",
-            "Density (g/mL)": "density",
-        }
-        state_is_not_empty = state_file.exists() and state_file.stat().st_size > 0
-        if state_is_not_empty:
-            data = pd.read_csv(state_file, header=0)
-            data = data.rename(columns=column_name_map)
-            data = data.filter(items=list(column_name_map.values()))
-            attributes: dict[str, Any] = data.to_dict(orient="list")  # type: ignore[assignment]
+        dir_path = os.fspath(dir_name)
+        state_file = os.path.join(dir_path, state_file_name)
+        state_is_not_empty = _size_or_zero(state_file) > 0
+        state_file_suffix = os.path.splitext(state_file)[1].lower()
+        if state_is_not_empty and state_file_suffix in (".parquet", ".feather"):
+            if pa is None:
+                raise ImportError(
+                    "pyarrow must be installed to read parquet or feather state files"
+                )
+            # columnar formats are pre-typed, only read the columns we need
+            if state_file_suffix == ".parquet":
+                schema_names = pa_pq.read_schema(state_file).names
+                table = pa_pq.read_table(
+                    state_file,
+                    columns=[name for name in schema_names if name in _STATE_CSV_COLS],
+                )
+            else:
+                # feather v2 is the arrow ipc file format, so the schema is in
+                # the footer and can be read without touching the columns
+                with pa.memory_map(state_file) as source:
+                    schema_names = pa_ipc.open_file(source).schema.names
+                table = pa_feather.read_table(
+                    state_file,
+                    columns=[name for name in schema_names if name in _STATE_CSV_COLS],
+                    memory_map=True,
+                )
+            attributes: dict[str, Any] = _state_table_to_dict(table)
+        elif state_is_not_empty and pl is not None:
+            # polars parses in parallel and hands back arrow-backed columns, but
+            # does not unescape the quoted step header so we read it ourselves
+            with open(state_file, newline="") as f:
+                header = next(csv.reader(f))
+            columns = [name for name in header if name in _STATE_COLUMN_NAME_MAP]
+            data = pl.read_csv(
+                state_file,
+                new_columns=header,
+                columns=columns,
+                schema_overrides={
+                    name: pl.Int64
+                    if _STATE_COLUMN_DTYPES[name] == "int64"
+                    else pl.Float64
+                    for name in columns
+                },
+            )
+            attributes = {
+                _STATE_COLUMN_NAME_MAP[name]: data.get_column(name).to_numpy()
+                for name in columns
+            }
+        elif state_is_not_empty and pa_csv is not None:
+            # the arrow reader is multithreaded and avoids pandas' dtype inference
+            short_rows = []
+            table = pa_csv.read_csv(
+                state_file,
+                read_options=pa_csv.ReadOptions(block_size=1 << 20),
+                parse_options=pa_csv.ParseOptions(
+                    invalid_row_handler=lambda row: short_rows.append(row) or "skip"
+                ),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types=_STATE_COLUMN_DTYPES
+                ),
+            )
+            if short_rows:
+                # arrow can only skip short rows, e.g. the last row of a job
+                # killed while writing; reread to pad them like the other readers
+                attributes = _read_state_csv(state_file)
+            else:
+                attributes = _state_table_to_dict(table)
+        elif state_is_not_empty:
+            attributes = _read_state_csv(state_file)
         else:
-            attributes = {name: None for name in column_name_map.values()}
+            attributes = {name: None for name in _STATE_PY_COLS}
             state_file_name = None  # type: ignore[assignment]
 
-        traj_file = Path(dir_name) / traj_file_name
-        traj_is_not_empty = traj_file.exists() and traj_file.stat().st_size > 0
+        # the reporter may only log the components of the total energy
+        if (
+            attributes.get("total_energy") is None
+            and attributes.get("potential_energy") is not None
+            and attributes.get("kinetic_energy") is not None
+        ):
+            attributes["total_energy"] = np.add(
+                attributes["potential_energy"], attributes["kinetic_energy"]
+            )
+
+        traj_file = os.path.join(dir_path, traj_file_name)
+        traj_is_not_empty = _size_or_zero(traj_file) > 0
         traj_file_name = traj_file_name if traj_is_not_empty else None  # type: ignore
 
         traj_blob: str | None = None
         if traj_is_not_empty and embed_traj:
-            with open(traj_file, "rb") as f:
-                traj_blob = f.read().hex()
+            traj_blob = _encode_traj(traj_file)
 
         return CalculationOutput(
-            dir_name=str(dir_name),
+            dir_name=dir_path,
             elapsed_time=elapsed_time,
             traj_file=traj_file_name,
             state_file=state_file_name,
@@ -201,6 +545,66 @@ class CalculationOutput(BaseModel):
             **attributes,
         )
 
+    @classmethod
+    def from_directories(
+        cls,
+        dir_names: Iterable[Union[Path, str]],
+        state_file_name: str,
+        traj_file_name: str,
+        embed_traj: bool = False,
+        n_jobs: int = -1,
+    ) -> list[CalculationOutput]:
+        """Extract data from the output files in many directories in parallel.
+
+        Parameters
+        -----------
+        dir_names : iterable of str or .Path
+            The directories to parse, one per calculation.
+        state_file_name : str
+            The name of the state file in each directory.
+        traj_file_name : str
+            The name of the trajectory file in each directory.
+        embed_traj : bool = False
+            Whether to embed the trajectory blob in each CalculationOutput.
+        n_jobs : int = -1
+            The number of worker processes, following joblib: negative
+            values use (n_cpus + 1 + n_jobs) processes, so -1 uses all CPUs
+            and -2 all but one. 1 parses the directories serially in this
+            process and 0 is not allowed. No more processes than directories
+            are started.
+
+        Notes
+        -----------
+        The worker processes are spawned rather than forked, so they re-import
+        the calling module. Scripts that use more than one process must call
+        this from under an ``if __name__ == "__main__":`` guard, otherwise the
+        pool fails with a BrokenProcessPool error.
+
+        Returns
+        -----------
+        list of CalculationOutput, in the same order as `dir_names`
+        """
+        from_directory = partial(
+            cls.from_directory,
+            state_file_name=state_file_name,
+            traj_file_name=traj_file_name,
+            embed_traj=embed_traj,
+        )
+        if n_jobs == 0:
+            raise ValueError("n_jobs must be a non-zero integer")
+        if n_jobs < 0:
+            n_jobs = max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+        dir_list = list(dir_names)
+        n_jobs = min(n_jobs, len(dir_list))
+        if n_jobs <= 1:
+            # starting a pool costs far more than parsing a single directory
+            return [from_directory(dir_name) for dir_name in dir_list]
+        # forking after the arrow or polars thread pools have started can deadlock
+        with ProcessPoolExecutor(
+            max_workers=n_jobs, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            return list(executor.map(from_directory, dir_list))
+
 
 class Calculation(BaseModel):
     """All input and output data for an OpenMM calculation."""
@@ -243,6 +647,75 @@ class OpenMMTaskDocument(MDTaskDocument):
         "task document.",
     )
 
+    @classmethod
+    def iter_outputs_scalar(
+        cls, store: Any, criteria: Optional[dict] = None
+    ) -> Iterator[OpenMMTaskDocument]:
+        """Iterate over the task documents in a store without loading blobs.
+
+        The serialized interchange and any embedded trajectories are projected
+        out of the query, so they are never transferred or decompressed. This
+        keeps memory low when scanning many documents for their reported
+        energies and other state data.
+
+        Parameters
+        -----------
+        store : maggma.core.Store
+            The store holding the task documents, any object with a
+            maggma-style ``query(criteria, properties)`` method works.
+        criteria : dict or None (default)
+            The query criteria.
+
+        Returns
+        -----------
+        Iterator of OpenMMTaskDocument
+        """
+        properties = {"interchange": 0, "calcs_reversed.output.traj_blob": 0}
+        for doc in store.query(criteria=criteria or {}, properties=properties):
+            doc.pop("_id", None)
+            yield cls(**doc)
+
+
+# parsed OpenMM states and topologies shared between interchanges, e.g. replicas
+_PARSED_CACHE: OrderedDict[tuple[str, bytes], Any] = OrderedDict()
+_PARSED_CACHE_SIZE = 16
+_DIGEST_CHUNK_SIZE = 1 << 20
+
+
+def _parse_cached(serialized: Union[str, bytes], parse: Callable[[Any], Any]) -> Any:
+    """Parse a serialized OpenMM object, reusing any identical earlier result.
+
+    Entries are keyed on a digest of the string so the cache does not hold
+    onto the (potentially very large) serialized strings themselves.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    if isinstance(serialized, str):
+        # encode in chunks rather than copying the whole string to bytes
+        for start in range(0, len(serialized), _DIGEST_CHUNK_SIZE):
+            hasher.update(serialized[start : start + _DIGEST_CHUNK_SIZE].encode())
+    else:
+        hasher.update(serialized)
+    digest = hasher.digest()
+    key = (parse.__name__, digest)
+    if key in _PARSED_CACHE:
+        _PARSED_CACHE.move_to_end(key)
+        return _PARSED_CACHE[key]
+    parsed = _PARSED_CACHE[key] = parse(serialized)
+    if len(_PARSED_CACHE) > _PARSED_CACHE_SIZE:
+        _PARSED_CACHE.popitem(last=False)
+    return parsed
+
+
+def _deserialize_xml(xml: str) -> Any:
+    return XmlSerializer.deserialize(xml)
+
+
+def _parse_pdb_topology(pdb: Union[str, bytes]) -> Topology:
+    # PDBFile decodes byte lines itself, so bytes are parsed without a copy
+    stream = io.BytesIO(pdb) if isinstance(pdb, bytes) else io.StringIO(pdb)
+    with stream as s:
+        return PDBFile(s).getTopology()
+
 
 class OpenMMInterchange(BaseModel):
     """An object to sit in the place of the Interchance object
@@ -255,11 +728,34 @@ class OpenMMInterchange(BaseModel):
         None,
         description="An XML file representing the OpenMM state.",
     )
-    topology: Optional[str] = Field(
+    topology: Optional[Union[str, bytes]] = Field(
         None,
-        description="An XML file representing an OpenMM topology object."
-        "This must correspond to the atom ordering in the system.",
-    )
+        description="A PDB file representing an OpenMM topology object, as a "
+        "string or bytes. This must correspond to the atom ordering in the system.",
+    )
+
+    _cached_state: Optional[openmm.State] = PrivateAttr(default=None)
+    _cached_state_hash: Optional[int] = PrivateAttr(default=None)
+
+    def _deserialize(self) -> tuple[openmm.System, openmm.State, Topology]:
+        """Parse the serialized system, state, and topology.
+
+        The state is reused while its string is unchanged and is shared with
+        interchanges holding an identical string. The system and topology are
+        parsed fresh on every call, as simulations mutate them (e.g. adding a
+        barostat or setting box vectors) and must not see each other's changes.
+        """
+        if self.system is None or self.state is None or self.topology is None:
+            raise ValueError(
+                "system, state, and topology must all be set to build a simulation"
+            )
+        state_hash = hash(self.state)
+        if self._cached_state_hash != state_hash:
+            self._cached_state = _parse_cached(self.state, _deserialize_xml)
+            self._cached_state_hash = state_hash
+        system = XmlSerializer.deserialize(self.system)
+        topology = _parse_pdb_topology(self.topology)
+        return system, self._cached_state, topology
 
     def to_openmm_simulation(
         self,
@@ -267,11 +763,7 @@ class OpenMMInterchange(BaseModel):
         platform: openmm.Platform,
         platformProperties: Optional[dict[str, str]] = None,
     ):
-        system = XmlSerializer.deserialize(self.system)
-        state = XmlSerializer.deserialize(self.state)
-        with io.StringIO(self.topology) as s:
-            pdb = PDBFile(s)
-            topology = pdb.getTopology()
+        system, state, topology = self._deserialize()
 
         simulation = Simulation(
             topology,
@@ -1,7 +1,23 @@
+import json
+import os
 from pathlib import Path
 
 import numpy as np
-from emmet.core.openmm.tasks import CalculationOutput
+import openmm
+import pandas as pd
+import pytest
+from openmm import XmlSerializer
+from pydantic import ValidationError
+
+import emmet.core.openmm.tasks as openmm_tasks
+from emmet.core.openff.tasks import compressed_str_serializer
+from emmet.core.openmm.tasks import (
+    Calculation,
+    CalculationOutput,
+    OpenMMInterchange,
+    OpenMMTaskDocument,
+    decode_traj_blob,
+)
 
 
 def test_calc_output_from_directory(test_dir):
@@ -33,3 +49,344 @@ def test_calc_output_from_directory(test_dir):
     # Assert the existence of the DCD and state files
     assert Path(calc_out.dir_name, calc_out.traj_file).exists()
     assert Path(calc_out.dir_name, calc_out.state_file).exists()
+
+    # time series are held as arrays and serialized as lists
+    assert isinstance(calc_out.potential_energy, np.ndarray)
+    assert isinstance(calc_out.model_dump()["potential_energy"], list)
+    assert CalculationOutput.model_validate_json(calc_out.model_dump_json()) == calc_out
+    assert json.loads(calc_out.model_dump_json()) == calc_out.model_dump(mode="json")
+
+
+def test_interchange_to_openmm_simulation():
+    system = openmm.System()
+    system.addParticle(1.0)
+    context = openmm.Context(
+        system,
+        openmm.VerletIntegrator(0.001),
+        openmm.Platform.getPlatformByName("Reference"),
+    )
+    context.setPositions([openmm.Vec3(0.1, 0.2, 0.3)])
+    topology = (
+        "HETATM    1  AR  ARG A   1       1.000   2.000   3.000  1.00  0.00          Ar\n"
+        "END\n"
+    )
+    interchange = OpenMMInterchange(
+        system=XmlSerializer.serialize(system),
+        state=XmlSerializer.serialize(context.getState(getPositions=True)),
+        topology=topology,
+    )
+
+    platform = openmm.Platform.getPlatformByName("Reference")
+    sim_1 = interchange.to_openmm_simulation(openmm.VerletIntegrator(0.001), platform)
+    # changes to one simulation's system must not leak into later ones
+    sim_1.system.addForce(openmm.CMMotionRemover())
+    sim_2 = interchange.to_openmm_simulation(openmm.VerletIntegrator(0.001), platform)
+    assert sim_2.system is not sim_1.system
+    assert sim_2.system.getNumForces() == 0
+
+    assert sim_1.topology.getNumAtoms() == 1
+    assert sim_2.topology is not sim_1.topology
+    assert [a.name for a in sim_2.topology.atoms()] == [
+        a.name for a in sim_1.topology.atoms()
+    ]
+    # nor may changes to one simulation's topology
+    sim_1.topology.setPeriodicBoxVectors(np.eye(3) * openmm.unit.nanometer)
+    sim_2 = interchange.to_openmm_simulation(openmm.VerletIntegrator(0.001), platform)
+    assert sim_2.topology.getPeriodicBoxVectors() is None
+
+    # interchanges holding the same strings build equal, unshared objects
+    replica = OpenMMInterchange(**interchange.model_dump())
+    sim_3 = replica.to_openmm_simulation(openmm.VerletIntegrator(0.001), platform)
+    assert sim_3.topology is not sim_1.topology
+    assert [a.name for a in sim_3.topology.atoms()] == [
+        a.name for a in sim_1.topology.atoms()
+    ]
+    assert sim_3.system.getNumForces() == 0
+
+    with pytest.raises(ValueError, match="must all be set"):
+        OpenMMInterchange(system=interchange.system).to_openmm_simulation(
+            openmm.VerletIntegrator(0.001), platform
+        )
+
+    # topologies kept as bytes are parsed without decoding them first
+    as_bytes = OpenMMInterchange(
+        system=interchange.system,
+        state=interchange.state,
+        topology=topology.encode(),
+    )
+    sim_4 = as_bytes.to_openmm_simulation(openmm.VerletIntegrator(0.001), platform)
+    assert sim_4.topology.getNumAtoms() == 1
+    positions = sim_2.context.getState(getPositions=True).getPositions(asNumpy=True)
+    assert np.allclose(positions._value, [[0.1, 0.2, 0.3]])
+
+
+def test_calc_output_non_contiguous_arrays():
+    times = np.arange(20.0).reshape(10, 2)[:, 0]
+    calc_out = CalculationOutput(time=times)
+    assert calc_out.time.flags.c_contiguous
+    assert json.loads(calc_out.model_dump_json())["time"] == times.tolist()
+
+    # arrays assigned without validation are serialized too
+    calc_out.time = times
+    assert json.loads(calc_out.model_dump_json())["time"] == times.tolist()
+
+
+def test_calc_output_arrays_not_copied():
+    steps = np.array([100, 200, 300], dtype=np.int64)
+    energies = np.array([-26192.4, -25648.6, -25149.6])
+    calc_out = CalculationOutput(steps_reported=steps, potential_energy=energies)
+
+    # writable contiguous arrays of the right dtype are stored without conversion
+    assert calc_out.steps_reported is steps
+    assert calc_out.potential_energy is energies
+
+
+def test_calc_output_array_validation():
+    with pytest.raises(ValidationError, match="1D"):
+        CalculationOutput(time=5.0)
+    with pytest.raises(ValidationError, match="1D"):
+        CalculationOutput(potential_energy=[[1.0, 2.0]])
+    with pytest.raises(ValidationError, match="integer"):
+        CalculationOutput(steps_reported=[1.7])
+
+    calc_out = CalculationOutput(steps_reported=[1.0, 2.0])
+    assert calc_out.steps_reported.dtype == np.int64
+
+
+@pytest.fixture(params=["polars", "pyarrow", "csv"])
+def state_reader(request, monkeypatch):
+    """Force from_directory to parse CSV state files with one reader."""
+    if request.param == "polars":
+        pytest.importorskip("polars")
+    else:
+        monkeypatch.setattr(openmm_tasks, "pl", None)
+    if request.param == "pyarrow":
+        pytest.importorskip("pyarrow")
+    elif request.param == "csv":
+        monkeypatch.setattr(openmm_tasks, "pa_csv", None)
+    return request.param
+
+
+def test_calc_output_arrays_writable(test_dir, state_reader):
+    output_dir = test_dir / "openmm" / "calc_output"
+    calc_out = CalculationOutput.from_directory(
+        output_dir, "state.csv", "trajectory.dcd"
+    )
+    calc_out.potential_energy[0] = 1.0
+    calc_out.steps_reported[0] = 1
+    assert calc_out.potential_energy[0] == 1.0
+    assert calc_out.steps_reported[0] == 1
+
+
+def test_calc_output_reader_arrays_copied_once(test_dir, state_reader, monkeypatch):
+    # record what each reader hands to the array validators
+    received = []
+    time_series_array = openmm_tasks._time_series_array
+
+    def spy(a):
+        received.append(a)
+        return time_series_array(a)
+
+    monkeypatch.setattr(openmm_tasks, "_time_series_array", spy)
+    output_dir = test_dir / "openmm" / "calc_output"
+    calc_out = CalculationOutput.from_directory(
+        output_dir, "state.csv", "trajectory.dcd"
+    )
+
+    stored = {id(v) for v in vars(calc_out).values() if isinstance(v, np.ndarray)}
+    assert len(received) == len(stored)
+    for a in received:
+        # read-only arrow and polars buffers are copied, anything else is kept
+        assert (id(a) in stored) == a.flags.writeable
+    if state_reader == "csv":
+        assert all(a.flags.writeable for a in received)
+
+
+def test_calc_output_extra_state_columns(test_dir, tmp_path, state_reader):
+    output_dir = test_dir / "openmm" / "calc_output"
+    data = pd.read_csv(output_dir / "state.csv")
+    data["Speed (ns/day)"] = 1.0
+    data.to_csv(tmp_path / "state.csv", index=False)
+
+    calc_out = CalculationOutput.from_directory(tmp_path, "state.csv", "trajectory.dcd")
+    assert calc_out.steps_reported.dtype == np.int64
+    assert calc_out.potential_energy.dtype == np.float64
+    assert np.array_equal(calc_out.steps_reported, data['#"Step"'])
+    assert np.allclose(calc_out.density, data["Density (g/mL)"])
+
+
+def test_calc_output_incomplete_state_file(test_dir, tmp_path, state_reader):
+    output_dir = test_dir / "openmm" / "calc_output"
+    with open(output_dir / "state.csv") as f:
+        header, *rows = f.read().splitlines()
+    # an empty field, then a last row cut off while it was being written
+    first = rows[0].split(",")
+    first[2] = ""
+    lines = [header, ",".join(first), rows[1], rows[2][:30]]
+    (tmp_path / "state.csv").write_text("\n".join(lines))
+
+    calc_out = CalculationOutput.from_directory(tmp_path, "state.csv", "trajectory.dcd")
+    assert calc_out.steps_reported.tolist() == [100, 200, 300]
+    assert np.isnan(calc_out.kinetic_energy[0])
+    assert calc_out.kinetic_energy[1] == float(rows[1].split(",")[2])
+    assert not np.isnan(calc_out.potential_energy[2])
+    assert np.isnan(calc_out.density[2])
+
+
+def test_calc_output_from_directory_columnar(test_dir, tmp_path):
+    pytest.importorskip("pyarrow")
+
+    output_dir = test_dir / "openmm" / "calc_output"
+    data = pd.read_csv(output_dir / "state.csv")
+    # extra reporter columns are not read into the output
+    data["Speed (ns/day)"] = 1.0
+    data.to_parquet(tmp_path / "state.parquet")
+    data.to_feather(tmp_path / "state.feather")
+
+    csv_out = CalculationOutput.from_directory(
+        output_dir, "state.csv", "trajectory.dcd"
+    )
+    for state_file_name in ("state.parquet", "state.feather"):
+        calc_out = CalculationOutput.from_directory(
+            tmp_path, state_file_name, "trajectory.dcd"
+        )
+        assert calc_out.state_file == state_file_name
+        assert calc_out.traj_file is None
+        assert np.array_equal(calc_out.steps_reported, csv_out.steps_reported)
+        assert np.allclose(calc_out.potential_energy, csv_out.potential_energy)
+        assert np.allclose(calc_out.density, csv_out.density)
+
+
+def test_calc_output_from_directory_not_a_directory(tmp_path):
+    not_a_dir = tmp_path / "calc_output"
+    not_a_dir.write_text("")
+    calc_out = CalculationOutput.from_directory(
+        not_a_dir, "state.csv", "trajectory.dcd"
+    )
+    assert calc_out.state_file is None
+    assert calc_out.traj_file is None
+    assert calc_out.steps_reported is None
+
+
+def test_calc_output_from_directory_csv_fallback(test_dir, monkeypatch):
+    output_dir = test_dir / "openmm" / "calc_output"
+    calc_out = CalculationOutput.from_directory(
+        output_dir, "state.csv", "trajectory.dcd"
+    )
+
+    monkeypatch.setattr(openmm_tasks, "pl", None)
+    monkeypatch.setattr(openmm_tasks, "pa_csv", None)
+    csv_out = CalculationOutput.from_directory(
+        output_dir, "state.csv", "trajectory.dcd"
+    )
+    assert csv_out == calc_out
+    assert csv_out.steps_reported.dtype == np.int64
+
+
+def test_calc_output_from_directories(test_dir, monkeypatch):
+    output_dir = test_dir / "openmm" / "calc_output"
+    calc_out = CalculationOutput.from_directory(
+        output_dir, "state.csv", "trajectory.dcd"
+    )
+
+    calc_outs = CalculationOutput.from_directories(
+        (d for d in [output_dir, output_dir]), "state.csv", "trajectory.dcd", n_jobs=2
+    )
+    assert calc_outs == [calc_out, calc_out]
+
+    # a single process, or a single directory, never starts a pool
+    def no_pool(*args, **kwargs):
+        raise AssertionError("ProcessPoolExecutor should not be started")
+
+    monkeypatch.setattr(openmm_tasks, "ProcessPoolExecutor", no_pool)
+    calc_outs = CalculationOutput.from_directories(
+        [output_dir, output_dir], "state.csv", "trajectory.dcd", n_jobs=1
+    )
+    assert calc_outs == [calc_out, calc_out]
+    calc_outs = CalculationOutput.from_directories(
+        [output_dir], "state.csv", "trajectory.dcd", n_jobs=-1
+    )
+    assert calc_outs == [calc_out]
+
+    # joblib-style negative values never drop below one process
+    calc_outs = CalculationOutput.from_directories(
+        [output_dir], "state.csv", "trajectory.dcd", n_jobs=-(os.cpu_count() or 1) - 1
+    )
+    assert calc_outs == [calc_out]
+
+    with pytest.raises(ValueError, match="n_jobs"):
+        CalculationOutput.from_directories(
+            [output_dir], "state.csv", "trajectory.dcd", n_jobs=0
+        )
+
+
+def test_calc_output_derived_total_energy(test_dir, tmp_path):
+    output_dir = test_dir / "openmm" / "calc_output"
+    data = pd.read_csv(output_dir / "state.csv")
+    data.drop(columns="Total Energy (kJ/mole)").to_csv(
+        tmp_path / "state.csv", index=False
+    )
+
+    calc_out = CalculationOutput.from_directory(tmp_path, "state.csv", "trajectory.dcd")
+    assert np.allclose(calc_out.total_energy, data["Total Energy (kJ/mole)"])
+
+
+def test_calc_output_embed_traj(test_dir):
+    output_dir = test_dir / "openmm" / "calc_output"
+    calc_out = CalculationOutput.from_directory(
+        output_dir, "state.csv", "trajectory.dcd", embed_traj=True
+    )
+
+    with open(output_dir / "trajectory.dcd", "rb") as f:
+        traj_bytes = f.read()
+    assert len(calc_out.traj_blob) < len(traj_bytes.hex())
+    assert decode_traj_blob(calc_out.traj_blob) == traj_bytes
+    # hex encoded blobs from older documents are still readable
+    assert decode_traj_blob(traj_bytes.hex()) == traj_bytes
+
+    # the compressed blob is stored as is, not compressed a second time
+    assert calc_out.model_dump()["traj_blob"] == calc_out.traj_blob
+    reloaded = CalculationOutput.model_validate_json(calc_out.model_dump_json())
+    assert decode_traj_blob(reloaded.traj_blob) == traj_bytes
+
+    # blobs stored by older versions as compressed hex strings still load
+    legacy = CalculationOutput(traj_blob=compressed_str_serializer(traj_bytes.hex()))
+    assert decode_traj_blob(legacy.traj_blob) == traj_bytes
+
+
+def test_task_doc_iter_outputs_scalar(test_dir):
+    output_dir = test_dir / "openmm" / "calc_output"
+    calc_out = CalculationOutput.from_directory(
+        output_dir, "state.csv", "trajectory.dcd", embed_traj=True
+    )
+    task_doc = OpenMMTaskDocument(
+        dir_name=str(output_dir),
+        interchange="interchange json",
+        calcs_reversed=[Calculation(output=calc_out)],
+    )
+
+    class ProjectingStore:
+        def __init__(self, docs):
+            self.docs = docs
+            self.properties = None
+
+        def query(self, criteria, properties):
+            self.properties = properties
+            for doc in self.docs:
+                doc = {k: v for k, v in doc.items() if k != "interchange"}
+                doc["calcs_reversed"] = [
+                    {**calc, "output": {**calc["output"], "traj_blob": None}}
+                    for calc in doc["calcs_reversed"]
+                ]
+                yield {"_id": 0, **doc}
+
+    store = ProjectingStore([task_doc.model_dump()])
+    (doc,) = OpenMMTaskDocument.iter_outputs_scalar(store)
+
+    assert store.properties["interchange"] == 0
+    assert store.properties["calcs_reversed.output.traj_blob"] == 0
+    assert doc.dir_name == str(output_dir)
+    assert doc.interchange is None
+    output = doc.calcs_reversed[0].output
+    assert output.traj_blob is None
+    assert np.allclose(output.potential_energy, calc_out.potential_energy)